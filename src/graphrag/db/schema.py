@@ -38,7 +38,7 @@ def validate_schema(conn: sqlite3.Connection) -> None:
     cursor = conn.execute(
         "SELECT name FROM sqlite_master WHERE type='table'"
     )
-    existing_tables = {row[0] for row in cursor.fetchall()}
+    existing_tables = {row[0] for row in cursor}
     
     missing = EXPECTED_TABLES - existing_tables
     if missing:
@@ -14,15 +14,55 @@ The database schema is produced by external indexers and uses:
 from __future__ import annotations
 
 import sqlite3
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from .schema import SymbolRole
 
 
+# =============================================================================
+# Shared Queries
+# =============================================================================
+
+# Relationships declared by a symbol (params: symbol_id)
+_RELATIONSHIPS_SQL = """
+    SELECT r.kind, r.target_symbol_id
+    FROM relationships r
+    WHERE r.symbol_id = ?
+"""
+
+# Members defined inside a symbol (params: enclosing symbol_id, definition role)
+_MEMBERS_SQL = """
+    SELECT DISTINCT o.symbol_id, s.kind
+    FROM occurrences o
+    JOIN symbols s ON s.symbol_id = o.symbol_id
+    WHERE o.enclosing_symbol = ? AND o.roles & ? != 0
+    ORDER BY o.symbol_id
+"""
+
+# Symbols conforming to, implementing or inheriting a target (params: target symbol_id, limit)
+_IMPLEMENTATIONS_SQL = """
+    SELECT DISTINCT 
+        s.symbol_id,
+        s.kind,
+        r.kind AS relationship_kind
+    FROM relationships r
+    JOIN symbols s ON s.symbol_id = r.symbol_id
+    WHERE r.target_symbol_id = ?
+      AND r.kind IN ('conforms', 'implements', 'inherits')
+    ORDER BY s.symbol_id
+    LIMIT ?
+"""
+
+
 # =============================================================================
 # Symbol ID Parsing Utilities
 # =============================================================================
 
+# Query results repeat the same symbol IDs (enclosing symbols, members), so
+# the parsers are memoized; both are pure functions of the ID string.
+
+@lru_cache(maxsize=4096)
 def _extract_name_from_symbol_id(symbol_id: str) -> str:
     """Extract the human-readable name from a SCIP symbol ID.
     
@@ -38,8 +78,8 @@ def _extract_name_from_symbol_id(symbol_id: str) -> str:
     if symbol_id.startswith("local "):
         return f"local_{symbol_id[6:]}"
     
-    # Split by common SCIP delimiters
-    parts = symbol_id.replace("#", " ").replace(".", " ").replace("()", " ").split()
+    # Split by common SCIP delimiters; only the last part is needed
+    parts = symbol_id.replace("#", " ").replace(".", " ").replace("()", " ").rsplit(maxsplit=1)
     if parts:
         # Return the last meaningful part (usually the name)
         return parts[-1].strip("`.") or symbol_id
@@ -47,6 +87,7 @@ def _extract_name_from_symbol_id(symbol_id: str) -> str:
     return symbol_id
 
 
+@lru_cache(maxsize=4096)
 def _extract_module_from_symbol_id(symbol_id: str) -> Optional[str]:
     """Extract the module name from a SCIP symbol ID.
     
@@ -123,7 +164,8 @@ def _get_definition_by_name(
         FROM symbols s
         WHERE s.symbol_id LIKE ? OR s.symbol_id LIKE ?
         ORDER BY 
-            CASE WHEN s.symbol_id LIKE ? THEN 0 ELSE 1 END
+            CASE WHEN s.symbol_id LIKE ? THEN 0 ELSE 1 END,
+            s.id
         LIMIT 20
         """,
         (f"%{name}#", f"%{name}%", f"%{name}#"),
@@ -189,37 +231,23 @@ def _get_definition_by_symbol_id(
     # Get inheritance/conformance relationships
     inherits = []
     conformances = []
-    rel_rows = conn.execute(
-        """
-        SELECT r.kind, r.target_symbol_id
-        FROM relationships r
-        WHERE r.symbol_id = ?
-        """,
-        (symbol_id,),
-    ).fetchall()
+    rel_rows = conn.execute(_RELATIONSHIPS_SQL, (symbol_id,)).fetchall()
     
-    for rel in rel_rows:
-        target_name = _extract_name_from_symbol_id(rel["target_symbol_id"])
-        if rel["kind"] == "inherits":
+    for rel_kind, target_symbol_id in rel_rows:
+        target_name = _extract_name_from_symbol_id(target_symbol_id)
+        if rel_kind == "inherits":
             inherits.append(target_name)
-        elif rel["kind"] in ("conforms", "implements"):
+        elif rel_kind in ("conforms", "implements"):
             conformances.append(target_name)
     
     # Get members (symbols that reference this as enclosing)
     member_rows = conn.execute(
-        """
-        SELECT DISTINCT o.symbol_id, s.kind
-        FROM occurrences o
-        JOIN symbols s ON s.symbol_id = o.symbol_id
-        WHERE o.enclosing_symbol = ? AND o.roles & ? != 0
-        ORDER BY o.symbol_id
-        """,
-        (symbol_id, SymbolRole.DEFINITION),
+        _MEMBERS_SQL, (symbol_id, SymbolRole.DEFINITION)
     ).fetchall()
     
     members = [
-        _format_member(_extract_name_from_symbol_id(r["symbol_id"]), r["kind"]) 
-        for r in member_rows
+        _format_member(_extract_name_from_symbol_id(member_id), member_kind) 
+        for member_id, member_kind in member_rows
     ]
     
     result: Dict[str, Any] = {
@@ -265,26 +293,26 @@ def find_references(
     Returns:
         Reference information with file locations and snippets.
     """
-    # Find matching symbols by searching symbol_id patterns
-    symbol_rows = conn.execute(
+    # Find the best matching symbol by searching symbol_id patterns
+    symbol_row = conn.execute(
         """
-        SELECT symbol_id, kind
+        SELECT symbol_id
         FROM symbols
         WHERE symbol_id LIKE ? OR symbol_id LIKE ?
-        ORDER BY CASE WHEN symbol_id LIKE ? THEN 0 ELSE 1 END
+        ORDER BY CASE WHEN symbol_id LIKE ? THEN 0 ELSE 1 END, id
+        LIMIT 1
         """,
         (f"%{symbol}#", f"%{symbol}%", f"%{symbol}#"),
-    ).fetchall()
+    ).fetchone()
     
-    if not symbol_rows:
+    if not symbol_row:
         return {
             "symbol": symbol,
             "reference_count": 0,
             "references": [],
         }
     
-    # Use the best matching symbol
-    symbol_id = symbol_rows[0]["symbol_id"]
+    symbol_id = symbol_row["symbol_id"]
     symbol_name = _extract_name_from_symbol_id(symbol_id)
     
     # Build role filter
@@ -301,8 +329,7 @@ def find_references(
             o.start_line, 
             o.start_column, 
             o.snippet,
-            o.enclosing_symbol,
-            o.roles
+            o.enclosing_symbol
         FROM occurrences o
         JOIN documents d ON d.id = o.file_id
         WHERE o.symbol_id = ? AND {role_filter}
@@ -328,19 +355,20 @@ def find_references(
     module = _extract_module_from_symbol_id(symbol_id)
     module_counts: Dict[str, int] = {}
     references = []
-    for row in ref_rows:
+    # Unpack by position: cheaper than sqlite3.Row name lookups per column
+    for file_path, start_line, start_column, snippet, enclosing_symbol in ref_rows:
         mod = module or "Unknown"
         module_counts[mod] = module_counts.get(mod, 0) + 1
         
         ref: Dict[str, Any] = {
-            "file": row["file_path"],
-            "line": row["start_line"],
-            "column": row["start_column"],
+            "file": file_path,
+            "line": start_line,
+            "column": start_column,
         }
-        if row["snippet"]:
-            ref["snippet"] = row["snippet"]
-        if row["enclosing_symbol"]:
-            ref["context"] = _extract_name_from_symbol_id(row["enclosing_symbol"])
+        if snippet:
+            ref["snippet"] = snippet
+        if enclosing_symbol:
+            ref["context"] = _extract_name_from_symbol_id(enclosing_symbol)
         
         references.append(ref)
     
@@ -372,48 +400,35 @@ def find_implementations(
         Implementation information with locations and member lists.
     """
     # Find the protocol symbol
-    protocol_rows = conn.execute(
+    protocol_row = conn.execute(
         """
-        SELECT symbol_id, kind
+        SELECT symbol_id
         FROM symbols
         WHERE symbol_id LIKE ? OR symbol_id LIKE ?
         ORDER BY 
             CASE WHEN symbol_id LIKE ? THEN 0 ELSE 1 END,
-            CASE WHEN kind = 'protocol' THEN 0 ELSE 1 END
+            CASE WHEN kind = 'protocol' THEN 0 ELSE 1 END,
+            id
+        LIMIT 1
         """,
         (f"%{protocol}#", f"%{protocol}%", f"%{protocol}#"),
-    ).fetchall()
+    ).fetchone()
     
-    if not protocol_rows:
+    if not protocol_row:
         return {
             "protocol": protocol,
             "implementation_count": 0,
             "implementations": [],
         }
     
-    protocol_id = protocol_rows[0]["symbol_id"]
+    protocol_id = protocol_row["symbol_id"]
     protocol_name = _extract_name_from_symbol_id(protocol_id)
     
     # Find implementations (symbols that conform to / implement this protocol)
-    impl_rows = conn.execute(
-        """
-        SELECT DISTINCT 
-            s.symbol_id,
-            s.kind,
-            r.kind AS relationship_kind
-        FROM relationships r
-        JOIN symbols s ON s.symbol_id = r.symbol_id
-        WHERE r.target_symbol_id = ?
-          AND r.kind IN ('conforms', 'implements', 'inherits')
-        ORDER BY s.symbol_id
-        LIMIT ?
-        """,
-        (protocol_id, limit),
-    ).fetchall()
+    impl_rows = conn.execute(_IMPLEMENTATIONS_SQL, (protocol_id, limit)).fetchall()
     
     implementations = []
-    for row in impl_rows:
-        impl_symbol_id = row["symbol_id"]
+    for impl_symbol_id, impl_kind, _relationship_kind in impl_rows:
         impl_name = _extract_name_from_symbol_id(impl_symbol_id)
         impl_module = _extract_module_from_symbol_id(impl_symbol_id)
         
@@ -431,19 +446,12 @@ def find_implementations(
         
         # Get implemented members
         member_rows = conn.execute(
-            """
-            SELECT DISTINCT o.symbol_id, s.kind
-            FROM occurrences o
-            JOIN symbols s ON s.symbol_id = o.symbol_id
-            WHERE o.enclosing_symbol = ? AND o.roles & ? != 0
-            ORDER BY o.symbol_id
-            """,
-            (impl_symbol_id, SymbolRole.DEFINITION),
+            _MEMBERS_SQL, (impl_symbol_id, SymbolRole.DEFINITION)
         ).fetchall()
         
         impl: Dict[str, Any] = {
             "name": impl_name,
-            "kind": row["kind"],
+            "kind": impl_kind,
             "module": impl_module,
         }
         
@@ -455,8 +463,8 @@ def find_implementations(
         
         if member_rows:
             impl["members_implemented"] = [
-                _format_member(_extract_name_from_symbol_id(m["symbol_id"]), m["kind"]) 
-                for m in member_rows
+                _format_member(_extract_name_from_symbol_id(member_id), member_kind) 
+                for member_id, member_kind in member_rows
             ]
         
         implementations.append(impl)
@@ -516,14 +524,20 @@ def search_symbols(
         SELECT 
             s.symbol_id,
             s.kind,
-            s.documentation,
             d.relative_path AS file_path,
             o.start_line,
             o.snippet
         FROM symbols s
-        LEFT JOIN occurrences o ON o.symbol_id = s.symbol_id AND o.roles & ? != 0
+        LEFT JOIN occurrences o ON o.id = (
+            SELECT o2.id
+            FROM occurrences o2
+            WHERE o2.symbol_id = s.symbol_id AND o2.roles & ? != 0
+            ORDER BY o2.start_line
+            LIMIT 1
+        )
         LEFT JOIN documents d ON d.id = o.file_id
         WHERE {where_clause}
+        GROUP BY s.symbol_id
         ORDER BY 
             CASE WHEN s.symbol_id LIKE ? THEN 0 ELSE 1 END,
             s.symbol_id
@@ -532,29 +546,24 @@ def search_symbols(
         [SymbolRole.DEFINITION] + params + [f"%{query}#", limit],
     ).fetchall()
     
+    # One row per symbol: the definition lookup and GROUP BY dedupe in SQL
     results = []
-    seen_symbols = set()
-    
-    for row in rows:
-        if row["symbol_id"] in seen_symbols:
-            continue
-        seen_symbols.add(row["symbol_id"])
-        
-        symbol_name = _extract_name_from_symbol_id(row["symbol_id"])
-        symbol_module = _extract_module_from_symbol_id(row["symbol_id"])
+    for symbol_id, symbol_kind, file_path, start_line, snippet in rows:
+        symbol_name = _extract_name_from_symbol_id(symbol_id)
+        symbol_module = _extract_module_from_symbol_id(symbol_id)
         
         result: Dict[str, Any] = {
             "name": symbol_name,
-            "kind": row["kind"],
+            "kind": symbol_kind,
             "module": symbol_module,
         }
         
-        if row["file_path"]:
-            result["file"] = row["file_path"]
-            result["line"] = row["start_line"]
+        if file_path:
+            result["file"] = file_path
+            result["line"] = start_line
         
-        if row["snippet"]:
-            result["snippet"] = row["snippet"]
+        if snippet:
+            result["snippet"] = snippet
         
         results.append(result)
     
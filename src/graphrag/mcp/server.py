@@ -40,7 +40,7 @@ def _resolve_settings(
 
 
 def _json_text(payload: Any) -> TextContent:
-    return TextContent(type="text", text=json.dumps(payload, indent=2, ensure_ascii=False))
+    return TextContent(type="text", text=json.dumps(payload, ensure_ascii=False))
 
 
 def _get_query_service() -> QueryService:
@@ -4,25 +4,39 @@ These fixtures create databases with the external indexer schema format.
 """
 import sqlite3
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator, Optional
 
 import pytest
 
 
-def create_external_indexer_db(db_path: Path) -> sqlite3.Connection:
+def create_empty_db() -> sqlite3.Connection:
+    """Create an empty in-memory database for tests that build partial schemas."""
+    return sqlite3.connect(":memory:", isolation_level=None)
+
+
+def create_external_indexer_db(db_path: Optional[Path] = None) -> sqlite3.Connection:
     """Create a test database with external indexer schema.
     
-    This mimics what an external indexer would produce.
+    This mimics what an external indexer would produce. Without a db_path
+    the database lives in memory; pass a path when the test reopens the
+    file through another connection.
     """
-    conn = sqlite3.connect(str(db_path))
+    target = str(db_path) if db_path is not None else ":memory:"
+    # Autocommit mode: the build and seed steps manage their own transactions
+    conn = sqlite3.connect(target, isolation_level=None)
     conn.row_factory = sqlite3.Row
     
-    # Apply PRAGMAs like external indexer would
+    # Apply PRAGMAs like external indexer would (WAL keeps the on-disk format
+    # that connect() reads in production); durability is irrelevant for
+    # throwaway test databases, so skip fsyncs entirely
     conn.execute("PRAGMA journal_mode = WAL;")
     conn.execute("PRAGMA cache_size = -20000;")  # 80MB
-    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA synchronous = OFF;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
     conn.execute("PRAGMA foreign_keys = ON;")
     
+    conn.execute("BEGIN")
+    
     # Create metadata table
     conn.execute("""
         CREATE TABLE IF NOT EXISTS metadata (
@@ -95,12 +109,19 @@ def create_external_indexer_db(db_path: Path) -> sqlite3.Connection:
     conn.execute("CREATE INDEX IF NOT EXISTS idx_symbols_file ON symbols(file_id)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_occurrences_symbol ON occurrences(symbol_id)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_occurrences_file ON occurrences(file_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_occurrences_enclosing ON occurrences(enclosing_symbol)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_relationships_symbol ON relationships(symbol_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_relationships_target ON relationships(target_symbol_id)")
     
     # Insert metadata
-    conn.execute("INSERT INTO metadata (key, value) VALUES ('version', '1')")
-    conn.execute("INSERT INTO metadata (key, value) VALUES ('tool', 'test-indexer')")
-    conn.execute("INSERT INTO metadata (key, value) VALUES ('project_root', '/test/project')")
+    conn.executemany(
+        "INSERT INTO metadata (key, value) VALUES (?, ?)",
+        [
+            ("version", "1"),
+            ("tool", "test-indexer"),
+            ("project_root", "/test/project"),
+        ],
+    )
     
     # Insert initial index state
     conn.execute("""
@@ -108,7 +129,7 @@ def create_external_indexer_db(db_path: Path) -> sqlite3.Connection:
         VALUES ('abc123', 1700000000, '[]')
     """)
     
-    conn.commit()
+    conn.execute("COMMIT")
     return conn
 
 
@@ -121,61 +142,112 @@ def seed_test_data(conn: sqlite3.Connection) -> None:
     - doSomething (function, member of MyClass)
     - MockMyClass (class in TestModule, conforms to IMyProtocol)
     """
+    conn.execute("BEGIN")
+    
     # Insert documents
-    conn.execute("""
-        INSERT INTO documents (relative_path, language, indexed_at) VALUES
-        ('Sources/MyClass.swift', 'swift', 1700000000),
-        ('Sources/IMyProtocol.swift', 'swift', 1700000000),
-        ('Sources/Assembly.swift', 'swift', 1700000000),
-        ('Tests/MyClassTests.swift', 'swift', 1700000000),
-        ('Tests/Mocks/MockMyClass.swift', 'swift', 1700000000)
-    """)
+    documents_rows = [
+        (path, "swift", 1700000000)
+        for path in (
+            "Sources/MyClass.swift",
+            "Sources/IMyProtocol.swift",
+            "Sources/Assembly.swift",
+            "Tests/MyClassTests.swift",
+            "Tests/Mocks/MockMyClass.swift",
+        )
+    ]
+    conn.executemany(
+        "INSERT INTO documents (relative_path, language, indexed_at) VALUES (?, ?, ?)",
+        documents_rows,
+    )
     
     # Get document IDs
-    docs = {row[0]: row[1] for row in conn.execute(
-        "SELECT relative_path, id FROM documents"
-    ).fetchall()}
+    docs = dict(conn.execute("SELECT relative_path, id FROM documents"))
     
     # Insert symbols
-    conn.execute("""
-        INSERT INTO symbols (symbol_id, kind, documentation, file_id) VALUES
-        ('swift MyModule MyClass#', 'class', 'A sample class for testing.', ?),
-        ('swift MyModule IMyProtocol#', 'protocol', NULL, ?),
-        ('swift MyModule MyClass#doSomething().', 'function', NULL, ?),
-        ('swift TestModule MockMyClass#', 'class', NULL, ?)
-    """, (
-        docs['Sources/MyClass.swift'],
-        docs['Sources/IMyProtocol.swift'],
-        docs['Sources/MyClass.swift'],
-        docs['Tests/Mocks/MockMyClass.swift'],
-    ))
+    symbols_rows = [
+        ("swift MyModule MyClass#", "class", "A sample class for testing.", docs["Sources/MyClass.swift"]),
+        ("swift MyModule IMyProtocol#", "protocol", None, docs["Sources/IMyProtocol.swift"]),
+        ("swift MyModule MyClass#doSomething().", "function", None, docs["Sources/MyClass.swift"]),
+        ("swift TestModule MockMyClass#", "class", None, docs["Tests/Mocks/MockMyClass.swift"]),
+    ]
+    conn.executemany(
+        "INSERT INTO symbols (symbol_id, kind, documentation, file_id) VALUES (?, ?, ?, ?)",
+        symbols_rows,
+    )
     
     # Insert relationships
-    conn.execute("""
-        INSERT INTO relationships (symbol_id, target_symbol_id, kind) VALUES
-        ('swift MyModule MyClass#', 'swift MyModule IMyProtocol#', 'conforms'),
-        ('swift TestModule MockMyClass#', 'swift MyModule IMyProtocol#', 'conforms')
-    """)
+    relationships_rows = [
+        ("swift MyModule MyClass#", "swift MyModule IMyProtocol#", "conforms"),
+        ("swift TestModule MockMyClass#", "swift MyModule IMyProtocol#", "conforms"),
+    ]
+    conn.executemany(
+        "INSERT INTO relationships (symbol_id, target_symbol_id, kind) VALUES (?, ?, ?)",
+        relationships_rows,
+    )
     
     # Insert occurrences
-    conn.execute("""
-        INSERT INTO occurrences (symbol_id, file_id, start_line, start_column, end_line, end_column, roles, snippet, enclosing_symbol) VALUES
-        ('swift MyModule MyClass#', ?, 10, 7, 10, 14, 1, 'class MyClass: IMyProtocol {', NULL),
-        ('swift MyModule MyClass#', ?, 15, 20, 15, 27, 8, 'let instance = MyClass()', 'swift MyModule Assembly#register().'),
-        ('swift MyModule MyClass#', ?, 5, 10, 5, 17, 8, 'var sut: MyClass!', 'swift TestModule MyClassTests#'),
-        ('swift MyModule IMyProtocol#', ?, 5, 10, 5, 21, 1, 'protocol IMyProtocol {', NULL),
-        ('swift MyModule MyClass#doSomething().', ?, 15, 10, 15, 21, 1, 'func doSomething() {', 'swift MyModule MyClass#'),
-        ('swift TestModule MockMyClass#', ?, 3, 7, 3, 18, 1, 'class MockMyClass: IMyProtocol {', NULL)
-    """, (
-        docs['Sources/MyClass.swift'],
-        docs['Sources/Assembly.swift'],
-        docs['Tests/MyClassTests.swift'],
-        docs['Sources/IMyProtocol.swift'],
-        docs['Sources/MyClass.swift'],
-        docs['Tests/Mocks/MockMyClass.swift'],
-    ))
-    
-    conn.commit()
+    occurrences_rows = [
+        ("swift MyModule MyClass#", docs["Sources/MyClass.swift"], 10, 7, 10, 14, 1,
+         "class MyClass: IMyProtocol {", None),
+        ("swift MyModule MyClass#", docs["Sources/Assembly.swift"], 15, 20, 15, 27, 8,
+         "let instance = MyClass()", "swift MyModule Assembly#register()."),
+        ("swift MyModule MyClass#", docs["Tests/MyClassTests.swift"], 5, 10, 5, 17, 8,
+         "var sut: MyClass!", "swift TestModule MyClassTests#"),
+        ("swift MyModule IMyProtocol#", docs["Sources/IMyProtocol.swift"], 5, 10, 5, 21, 1,
+         "protocol IMyProtocol {", None),
+        ("swift MyModule MyClass#doSomething().", docs["Sources/MyClass.swift"], 15, 10, 15, 21, 1,
+         "func doSomething() {", "swift MyModule MyClass#"),
+        ("swift TestModule MockMyClass#", docs["Tests/Mocks/MockMyClass.swift"], 3, 7, 3, 18, 1,
+         "class MockMyClass: IMyProtocol {", None),
+    ]
+    conn.executemany(
+        """
+        INSERT INTO occurrences (symbol_id, file_id, start_line, start_column, end_line, end_column, roles, snippet, enclosing_symbol)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        occurrences_rows,
+    )
+    
+    conn.execute("COMMIT")
+
+
+@pytest.fixture(scope="session")
+def seeded_db_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build and seed one test database shared by all read-only tests."""
+    db_path = tmp_path_factory.mktemp("shared") / "test.db"
+    conn = create_external_indexer_db(db_path)
+    seed_test_data(conn)
+    conn.close()
+    return db_path
+
+
+@pytest.fixture(scope="class")
+def seeded_conn(seeded_db_path: Path) -> Iterator[sqlite3.Connection]:
+    """Open a read-only connection to the shared seeded database.
+    
+    Tests in the same class share the connection; module-level tests
+    each get their own.
+    """
+    conn = sqlite3.connect(f"file:{seeded_db_path}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def db_conn() -> Iterator[sqlite3.Connection]:
+    """In-memory external indexer database, closed even if the test fails."""
+    conn = create_external_indexer_db()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def empty_conn() -> Iterator[sqlite3.Connection]:
+    """Empty in-memory database, closed even if the test fails."""
+    conn = create_empty_db()
+    yield conn
+    conn.close()
 
 
 @pytest.fixture
@@ -1,7 +1,6 @@
 """Tests for database schema validation."""
 
 import sqlite3
-from pathlib import Path
 
 import pytest
 
@@ -13,47 +12,58 @@ from graphrag.db.schema import (
     get_metadata,
     validate_schema,
 )
+from graphrag.db.scip_queries import (
+    _IMPLEMENTATIONS_SQL,
+    _MEMBERS_SQL,
+    _RELATIONSHIPS_SQL,
+)
 
-from conftest import create_external_indexer_db
 
+def _get_plan_text(rows) -> str:
+    """Join the detail column of EXPLAIN QUERY PLAN rows."""
+    return " ".join(row[3] for row in rows)
 
-def test_expected_tables_defined():
-    """Verify expected tables are defined."""
-    assert "metadata" in EXPECTED_TABLES
-    assert "index_state" in EXPECTED_TABLES
-    assert "documents" in EXPECTED_TABLES
-    assert "symbols" in EXPECTED_TABLES
-    assert "relationships" in EXPECTED_TABLES
-    assert "occurrences" in EXPECTED_TABLES
 
+def _assert_uses_index(
+    conn: sqlite3.Connection, sql: str, params: tuple, index_name: str
+) -> None:
+    """Assert the query plan for sql searches through index_name."""
+    plan_text = _get_plan_text(conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall())
+    assert index_name in plan_text, plan_text
 
-def test_validate_schema_passes_for_valid_db(tmp_path: Path):
+
+def test_expected_tables_defined():
+    """Verify expected tables are defined."""
+    assert isinstance(EXPECTED_TABLES, frozenset)
+    assert {
+        "metadata",
+        "index_state",
+        "documents",
+        "symbols",
+        "relationships",
+        "occurrences",
+    } <= EXPECTED_TABLES
+
+
+def test_validate_schema_passes_for_valid_db(seeded_conn: sqlite3.Connection):
     """Verify validate_schema passes for a valid external indexer database."""
-    db_path = tmp_path / "test.db"
-    conn = create_external_indexer_db(db_path)
-    
     # Should not raise
-    validate_schema(conn)
-    conn.close()
+    validate_schema(seeded_conn)
 
 
-def test_validate_schema_raises_for_missing_tables(tmp_path: Path):
+def test_validate_schema_raises_for_missing_tables(empty_conn: sqlite3.Connection):
     """Verify validate_schema raises SchemaError when tables are missing."""
-    db_path = tmp_path / "empty.db"
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
     
     # Create only some tables
-    conn.execute("CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT)")
-    conn.execute("CREATE TABLE documents (id INTEGER PRIMARY KEY)")
+    empty_conn.execute("CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT)")
+    empty_conn.execute("CREATE TABLE documents (id INTEGER PRIMARY KEY)")
     
     with pytest.raises(SchemaError) as exc_info:
-        validate_schema(conn)
+        validate_schema(empty_conn)
     
     error_msg = str(exc_info.value)
     assert "missing required tables" in error_msg.lower()
     assert "symbols" in error_msg or "occurrences" in error_msg
-    conn.close()
 
 
 def test_symbol_role_constants():
@@ -67,106 +77,87 @@ def test_symbol_role_constants():
     assert SymbolRole.TEST == 32
 
 
-def test_get_metadata(tmp_path: Path):
+def test_get_metadata(seeded_conn: sqlite3.Connection):
     """Verify get_metadata retrieves values correctly."""
-    db_path = tmp_path / "test.db"
-    conn = create_external_indexer_db(db_path)
-    
-    assert get_metadata(conn, "version") == "1"
-    assert get_metadata(conn, "tool") == "test-indexer"
-    assert get_metadata(conn, "project_root") == "/test/project"
-    assert get_metadata(conn, "nonexistent") is None
-    conn.close()
+    assert get_metadata(seeded_conn, "version") == "1"
+    assert get_metadata(seeded_conn, "tool") == "test-indexer"
+    assert get_metadata(seeded_conn, "project_root") == "/test/project"
+    assert get_metadata(seeded_conn, "nonexistent") is None
 
 
-def test_get_index_state(tmp_path: Path):
+def test_get_index_state(seeded_conn: sqlite3.Connection):
     """Verify get_index_state retrieves state correctly."""
-    db_path = tmp_path / "test.db"
-    conn = create_external_indexer_db(db_path)
-    
-    state = get_index_state(conn)
+    state = get_index_state(seeded_conn)
     
     assert state is not None
     assert state["last_commit_hash"] == "abc123"
     assert state["last_indexed_at"] == 1700000000
-    conn.close()
 
 
-def test_get_index_state_empty_db(tmp_path: Path):
+def test_get_index_state_empty_db(empty_conn: sqlite3.Connection):
     """Verify get_index_state returns None for empty index_state."""
-    db_path = tmp_path / "test.db"
-    conn = sqlite3.connect(str(db_path))
-    conn.execute("CREATE TABLE index_state (last_commit_hash TEXT, last_indexed_at INTEGER, indexed_files TEXT)")
+    empty_conn.execute("CREATE TABLE index_state (last_commit_hash TEXT, last_indexed_at INTEGER, indexed_files TEXT)")
     
-    state = get_index_state(conn)
+    state = get_index_state(empty_conn)
     
     assert state is None
-    conn.close()
 
 
-def test_documents_table_structure(tmp_path: Path):
+def test_documents_table_structure(db_conn: sqlite3.Connection):
     """Verify documents table has correct structure."""
-    db_path = tmp_path / "test.db"
-    conn = create_external_indexer_db(db_path)
     
     # Insert a document
-    conn.execute("""
+    db_conn.execute("""
         INSERT INTO documents (relative_path, language, indexed_at)
         VALUES ('Sources/Test.swift', 'swift', 1700000000)
     """)
     
-    row = conn.execute("SELECT * FROM documents WHERE relative_path = 'Sources/Test.swift'").fetchone()
+    row = db_conn.execute("SELECT * FROM documents WHERE relative_path = 'Sources/Test.swift'").fetchone()
     
     assert row["relative_path"] == "Sources/Test.swift"
     assert row["language"] == "swift"
     assert row["indexed_at"] == 1700000000
-    conn.close()
 
 
-def test_symbols_table_structure(tmp_path: Path):
+def test_symbols_table_structure(db_conn: sqlite3.Connection):
     """Verify symbols table has correct structure."""
-    db_path = tmp_path / "test.db"
-    conn = create_external_indexer_db(db_path)
     
     # Insert document first (for FK)
-    conn.execute("""
+    db_conn.execute("""
         INSERT INTO documents (relative_path, language, indexed_at)
         VALUES ('Sources/Test.swift', 'swift', 1700000000)
     """)
     
     # Insert symbol
-    conn.execute("""
+    db_conn.execute("""
         INSERT INTO symbols (symbol_id, kind, documentation, file_id)
         VALUES ('swift Test MyClass#', 'class', 'A test class', 1)
     """)
     
-    row = conn.execute("SELECT * FROM symbols WHERE symbol_id = 'swift Test MyClass#'").fetchone()
+    row = db_conn.execute("SELECT * FROM symbols WHERE symbol_id = 'swift Test MyClass#'").fetchone()
     
     assert row["symbol_id"] == "swift Test MyClass#"
     assert row["kind"] == "class"
     assert row["documentation"] == "A test class"
     assert row["file_id"] == 1
-    conn.close()
 
 
-def test_occurrences_table_structure(tmp_path: Path):
+def test_occurrences_table_structure(db_conn: sqlite3.Connection):
     """Verify occurrences table has correct structure."""
-    db_path = tmp_path / "test.db"
-    conn = create_external_indexer_db(db_path)
     
     # Insert document
-    conn.execute("""
+    db_conn.execute("""
         INSERT INTO documents (relative_path, language, indexed_at)
         VALUES ('Sources/Test.swift', 'swift', 1700000000)
     """)
     
     # Insert occurrence
-    conn.execute("""
+    db_conn.execute("""
         INSERT INTO occurrences (symbol_id, file_id, start_line, start_column, end_line, end_column, roles, snippet)
         VALUES ('swift Test MyClass#', 1, 10, 7, 10, 14, 1, 'class MyClass {')
     """)
     
-    row = conn.execute("SELECT * FROM occurrences").fetchone()
+    row = db_conn.execute("SELECT * FROM occurrences").fetchone()
     
     assert row["symbol_id"] == "swift Test MyClass#"
     assert row["file_id"] == 1
@@ -174,23 +165,49 @@ def test_occurrences_table_structure(tmp_path: Path):
     assert row["start_column"] == 7
     assert row["roles"] == SymbolRole.DEFINITION
     assert row["snippet"] == "class MyClass {"
-    conn.close()
 
 
-def test_relationships_table_structure(tmp_path: Path):
+def test_relationships_table_structure(db_conn: sqlite3.Connection):
     """Verify relationships table has correct structure."""
-    db_path = tmp_path / "test.db"
-    conn = create_external_indexer_db(db_path)
     
     # Insert relationship
-    conn.execute("""
+    db_conn.execute("""
         INSERT INTO relationships (symbol_id, target_symbol_id, kind)
         VALUES ('swift Test MyClass#', 'swift Test IProtocol#', 'conforms')
     """)
     
-    row = conn.execute("SELECT * FROM relationships").fetchone()
+    row = db_conn.execute("SELECT * FROM relationships").fetchone()
     
     assert row["symbol_id"] == "swift Test MyClass#"
     assert row["target_symbol_id"] == "swift Test IProtocol#"
     assert row["kind"] == "conforms"
-    conn.close()
+
+
+@pytest.mark.parametrize(
+    ("sql", "params", "index_name"),
+    [
+        pytest.param(
+            _MEMBERS_SQL,
+            ("swift MyModule MyClass#", SymbolRole.DEFINITION),
+            "idx_occurrences_enclosing",
+            id="members",
+        ),
+        pytest.param(
+            _RELATIONSHIPS_SQL,
+            ("swift MyModule MyClass#",),
+            "idx_relationships_symbol",
+            id="relationships",
+        ),
+        pytest.param(
+            _IMPLEMENTATIONS_SQL,
+            ("swift MyModule IMyProtocol#", 50),
+            "idx_relationships_target",
+            id="implementations",
+        ),
+    ],
+)
+def test_navigation_queries_use_indexes(
+    seeded_conn: sqlite3.Connection, sql: str, params: tuple, index_name: str
+):
+    """Verify the shared navigation queries are served by the indexer's indexes."""
+    _assert_uses_index(seeded_conn, sql, params, index_name)
@@ -1,7 +1,6 @@
 """Tests for SCIP-based code navigation queries."""
 
 import sqlite3
-from pathlib import Path
 
 import pytest
 
@@ -15,194 +14,131 @@ from graphrag.db.scip_queries import (
     _extract_module_from_symbol_id,
 )
 
-from conftest import create_external_indexer_db, seed_test_data
+from conftest import seed_test_data
 
 
 class TestSymbolIdParsing:
     """Tests for symbol ID parsing utilities."""
 
-    def test_extract_name_from_class_symbol(self):
-        assert _extract_name_from_symbol_id("swift MyModule MyClass#") == "MyClass"
-
-    def test_extract_name_from_method_symbol(self):
-        assert _extract_name_from_symbol_id("swift MyModule MyClass#doSomething().") == "doSomething"
-
-    def test_extract_name_from_local_symbol(self):
-        assert _extract_name_from_symbol_id("local 42") == "local_42"
-
-    def test_extract_module_from_symbol(self):
-        assert _extract_module_from_symbol_id("swift MyModule MyClass#") == "MyModule"
-
-    def test_extract_module_from_local_returns_none(self):
-        assert _extract_module_from_symbol_id("local 42") is None
+    @pytest.mark.parametrize(
+        "symbol_id,expected",
+        [
+            ("swift MyModule MyClass#", "MyClass"),
+            ("swift MyModule MyClass#doSomething().", "doSomething"),
+            ("local 42", "local_42"),
+            ("swift MyModule MyClass#`init`().", "init"),
+        ],
+        ids=["class", "method", "local", "escaped"],
+    )
+    def test_extract_name(self, symbol_id: str, expected: str):
+        assert _extract_name_from_symbol_id(symbol_id) == expected
+
+    @pytest.mark.parametrize(
+        "symbol_id,expected",
+        [
+            ("swift MyModule MyClass#", "MyModule"),
+            ("local 42", None),
+        ],
+        ids=["symbol", "local"],
+    )
+    def test_extract_module(self, symbol_id: str, expected):
+        assert _extract_module_from_symbol_id(symbol_id) == expected
+
+
+@pytest.fixture(scope="class")
+def myclass_def(seeded_conn: sqlite3.Connection):
+    """Resolve MyClass once per class; tests only read the result."""
+    return go_to_definition(seeded_conn, "MyClass")
 
 
 class TestGoToDefinition:
     """Tests for go_to_definition query."""
 
-    def test_finds_class_definition(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
-
-        result = go_to_definition(conn, "MyClass")
-
-        assert result is not None
-        assert result["symbol"] == "MyClass"
-        assert result["kind"] == "class"
-        assert result["module"] == "MyModule"
-        assert result["definition"]["file"] == "Sources/MyClass.swift"
-        assert result["definition"]["line"] == 10
-        assert "class MyClass" in result["definition"]["snippet"]
-        conn.close()
-
-    def test_includes_conformances(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
-
-        result = go_to_definition(conn, "MyClass")
-
-        assert "conformances" in result
-        assert "IMyProtocol" in result["conformances"]
-        conn.close()
-
-    def test_includes_members(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
-
-        result = go_to_definition(conn, "MyClass")
-
-        assert "members" in result
-        assert "doSomething()" in result["members"]
-        conn.close()
-
-    def test_includes_documentation(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
-
-        result = go_to_definition(conn, "MyClass")
-
-        assert result["documentation"] == "A sample class for testing."
-        conn.close()
-
-    def test_finds_protocol_definition(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
-
-        result = go_to_definition(conn, "IMyProtocol")
+    def test_finds_class_definition(self, myclass_def):
+        assert myclass_def is not None
+        assert myclass_def["symbol"] == "MyClass"
+        assert myclass_def["kind"] == "class"
+        assert myclass_def["module"] == "MyModule"
+        assert myclass_def["definition"]["file"] == "Sources/MyClass.swift"
+        assert myclass_def["definition"]["line"] == 10
+        assert "class MyClass" in myclass_def["definition"]["snippet"]
+        assert "IMyProtocol" in myclass_def["conformances"]
+        assert "doSomething()" in myclass_def["members"]
+        assert myclass_def["documentation"] == "A sample class for testing."
+
+    def test_finds_protocol_definition(self, seeded_conn: sqlite3.Connection):
+        result = go_to_definition(seeded_conn, "IMyProtocol")
 
         assert result is not None
         assert result["kind"] == "protocol"
         assert result["definition"]["file"] == "Sources/IMyProtocol.swift"
-        conn.close()
-
-    def test_returns_none_for_unknown_symbol(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
 
-        result = go_to_definition(conn, "NonExistent")
+    def test_returns_none_for_unknown_symbol(self, seeded_conn: sqlite3.Connection):
+        result = go_to_definition(seeded_conn, "NonExistent")
 
         assert result is None
-        conn.close()
-
-    def test_finds_by_file_and_line_context(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
 
+    def test_finds_by_file_and_line_context(self, seeded_conn: sqlite3.Connection):
         # Should find the MyClass reference at line 15 in Assembly.swift
-        result = go_to_definition(conn, "anything", file_path="Sources/Assembly.swift", line=15)
+        result = go_to_definition(seeded_conn, "anything", file_path="Sources/Assembly.swift", line=15)
 
         assert result is not None
         assert result["symbol"] == "MyClass"
-        conn.close()
 
 
 class TestFindReferences:
     """Tests for find_references query."""
 
-    def test_finds_all_references(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
-
-        result = find_references(conn, "MyClass")
+    def test_finds_all_references(self, seeded_conn: sqlite3.Connection):
+        result = find_references(seeded_conn, "MyClass")
 
         assert result["symbol"] == "MyClass"
         assert result["reference_count"] == 2  # Excludes definition
         assert len(result["references"]) == 2
-        conn.close()
-
-    def test_includes_definitions_when_requested(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
 
-        result = find_references(conn, "MyClass", include_definitions=True)
+    def test_includes_definitions_when_requested(self, seeded_conn: sqlite3.Connection):
+        result = find_references(seeded_conn, "MyClass", include_definitions=True)
 
         assert result["reference_count"] == 3  # Includes definition
-        conn.close()
 
-    def test_includes_context_info(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
-
-        result = find_references(conn, "MyClass")
+    def test_includes_context_info(self, seeded_conn: sqlite3.Connection):
+        result = find_references(seeded_conn, "MyClass")
 
         # At least one reference should have context
         refs_with_context = [r for r in result["references"] if "context" in r]
         assert len(refs_with_context) > 0
-        conn.close()
-
-    def test_groups_by_module(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
 
-        result = find_references(conn, "MyClass")
+    def test_groups_by_module(self, seeded_conn: sqlite3.Connection):
+        result = find_references(seeded_conn, "MyClass")
 
         assert "grouped_by_module" in result
         assert "MyModule" in result["grouped_by_module"]
-        conn.close()
 
-    def test_respects_limit(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
-
-        result = find_references(conn, "MyClass", limit=1)
+    def test_respects_limit(self, seeded_conn: sqlite3.Connection):
+        result = find_references(seeded_conn, "MyClass", limit=1)
 
         assert len(result["references"]) == 1
         assert result["reference_count"] == 2  # Total count is still correct
-        conn.close()
 
-    def test_returns_empty_for_unknown_symbol(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
+    def test_ambiguous_partial_name_matches_go_to_definition(self, seeded_conn: sqlite3.Connection):
+        # "My" matches several symbols; ties resolve in insertion order
+        result = find_references(seeded_conn, "My")
+
+        assert result["symbol"] == "MyClass"
+        assert result["symbol"] == go_to_definition(seeded_conn, "My")["symbol"]
 
-        result = find_references(conn, "NonExistent")
+    def test_returns_empty_for_unknown_symbol(self, seeded_conn: sqlite3.Connection):
+        result = find_references(seeded_conn, "NonExistent")
 
         assert result["reference_count"] == 0
         assert len(result["references"]) == 0
-        conn.close()
 
 
 class TestFindImplementations:
     """Tests for find_implementations query."""
 
-    def test_finds_protocol_implementations(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
-
-        result = find_implementations(conn, "IMyProtocol")
+    def test_finds_protocol_implementations(self, seeded_conn: sqlite3.Connection):
+        result = find_implementations(seeded_conn, "IMyProtocol")
 
         assert result["protocol"] == "IMyProtocol"
         assert result["implementation_count"] == 2
@@ -210,95 +146,69 @@ class TestFindImplementations:
         impl_names = {i["name"] for i in result["implementations"]}
         assert "MyClass" in impl_names
         assert "MockMyClass" in impl_names
-        conn.close()
-
-    def test_includes_implementation_details(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
 
-        result = find_implementations(conn, "IMyProtocol")
+    def test_includes_implementation_details(self, seeded_conn: sqlite3.Connection):
+        result = find_implementations(seeded_conn, "IMyProtocol")
 
-        my_class = next(i for i in result["implementations"] if i["name"] == "MyClass")
+        by_name = {i["name"]: i for i in result["implementations"]}
+        my_class = by_name["MyClass"]
         assert my_class["kind"] == "class"
         assert my_class["module"] == "MyModule"
         assert my_class["file"] == "Sources/MyClass.swift"
-        conn.close()
 
-    def test_returns_empty_for_unknown_protocol(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
-
-        result = find_implementations(conn, "NonExistent")
+    def test_returns_empty_for_unknown_protocol(self, seeded_conn: sqlite3.Connection):
+        result = find_implementations(seeded_conn, "NonExistent")
 
         assert result["implementation_count"] == 0
-        conn.close()
 
 
 class TestSearchSymbols:
     """Tests for search_symbols query."""
 
-    def test_finds_exact_match(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
-
-        results = search_symbols(conn, "MyClass")
+    def test_finds_exact_match(self, seeded_conn: sqlite3.Connection):
+        results = search_symbols(seeded_conn, "MyClass")
 
         assert len(results) >= 1
         assert results[0]["name"] == "MyClass"
-        conn.close()
-
-    def test_finds_partial_match(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
 
-        results = search_symbols(conn, "Mock")
+    def test_finds_partial_match(self, seeded_conn: sqlite3.Connection):
+        results = search_symbols(seeded_conn, "Mock")
 
         names = {r["name"] for r in results}
         assert "MockMyClass" in names
-        conn.close()
 
-    def test_wildcard_prefix(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
-
-        results = search_symbols(conn, "*Protocol")
+    def test_wildcard_prefix(self, seeded_conn: sqlite3.Connection):
+        results = search_symbols(seeded_conn, "*Protocol")
 
         names = {r["name"] for r in results}
         assert "IMyProtocol" in names
-        conn.close()
-
-    def test_wildcard_suffix(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
 
-        results = search_symbols(conn, "My*")
+    def test_wildcard_suffix(self, seeded_conn: sqlite3.Connection):
+        results = search_symbols(seeded_conn, "My*")
 
         names = {r["name"] for r in results}
         assert "MyClass" in names
-        conn.close()
 
-    def test_filters_by_kind(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
-
-        results = search_symbols(conn, "*", kind="protocol")
+    def test_filters_by_kind(self, seeded_conn: sqlite3.Connection):
+        results = search_symbols(seeded_conn, "*", kind="protocol")
 
         assert all(r["kind"] == "protocol" for r in results)
-        conn.close()
-
-    def test_respects_limit(self, tmp_path: Path):
-        db_path = tmp_path / "test.db"
-        conn = create_external_indexer_db(db_path)
-        seed_test_data(conn)
 
-        results = search_symbols(conn, "*", limit=1)
+    def test_respects_limit(self, seeded_conn: sqlite3.Connection):
+        results = search_symbols(seeded_conn, "*", limit=1)
 
         assert len(results) == 1
-        conn.close()
+
+    def test_limit_counts_distinct_symbols(self, db_conn: sqlite3.Connection):
+        seed_test_data(db_conn)
+        # A second definition of MyClass must not take up a result slot
+        db_conn.execute("""
+            INSERT INTO occurrences (symbol_id, file_id, start_line, start_column, end_line, end_column, roles)
+            VALUES ('swift MyModule MyClass#', 1, 2, 0, 2, 7, 1)
+        """)
+
+        results = search_symbols(db_conn, "*", limit=3)
+
+        names = [r["name"] for r in results]
+        assert len(names) == 3
+        assert len(set(names)) == 3